@@ -0,0 +1,332 @@
+# /workspace/ULTIMATE-META-SYSTEM/benchmarks/engine_benchmarks.py
+
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+if str(SYSTEM_ROOT) not in sys.path:
+    sys.path.insert(0, str(SYSTEM_ROOT))
+
+from deploy_perfect_storm import load_engine
+
+# Size knobs for the synthetic fixtures
+DEFAULT_SIZES = {
+    'repositories': 3,     # local bare repositories cloned by clone_and_analyze_all_repos
+    'files': 200,          # files per synthetic repository / analysis dict
+    'capabilities': 50,    # capabilities per synthetic system
+    'systems': 6,          # systems handed to the merge and the connector
+    'components': 20       # architecture components per system / generated system
+}
+
+# A benchmark regresses when its median is this much slower than the baseline
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+FILE_TYPES = ['py', 'rs', 'ts', 'js', 'go', 'md', 'yaml', 'json', 'sol', 'toml']
+CODE_PATTERNS = ['singleton', 'factory', 'observer', 'pipeline', 'actor', 'repository', 'strategy']
+
+
+def make_analysis_dict(name: str, sizes: Dict[str, int]) -> Dict[str, Any]:
+    """Build a synthetic analysis dict shaped like MetaRepositoryCEO._deep_analyze_repository output"""
+
+    files = sizes['files']
+    file_types = {
+        file_type: files // len(FILE_TYPES) + (1 if index < files % len(FILE_TYPES) else 0)
+        for index, file_type in enumerate(FILE_TYPES)
+    }
+    components = {
+        f"{name}_component_{index}": {
+            'type': 'service' if index % 3 else 'library',
+            'depends_on': [f"{name}_component_{dep}" for dep in range(max(0, index - 2), index)]
+        }
+        for index in range(sizes['components'])
+    }
+
+    return {
+        'file_structure': {
+            'total_files': files,
+            'file_types': file_types,
+            'directories': [f"src/module_{index}" for index in range(max(1, files // 20))]
+        },
+        'code_patterns': {
+            pattern: {'occurrences': (index + 1) * 3} for index, pattern in enumerate(CODE_PATTERNS)
+        },
+        'dependencies': {f"dependency_{index}": f"{index}.0.0" for index in range(max(1, files // 10))},
+        'architecture': {'style': 'microservices', 'components': components},
+        'capabilities': [f"{name}_capability_{index}" for index in range(sizes['capabilities'])],
+        'performance_characteristics': {'latency_ms': 12.5, 'throughput_rps': 1500.0},
+        'security_posture': {'score': 0.8, 'findings': []},
+        'integration_points': [f"{name}_api_{index}" for index in range(max(1, sizes['components'] // 4))]
+    }
+
+
+def make_systems(sizes: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+    """Build ``sizes['systems']`` synthetic analysis dicts keyed by system name"""
+
+    return {
+        f"synthetic-system-{index}": make_analysis_dict(f"synthetic-system-{index}", sizes)
+        for index in range(sizes['systems'])
+    }
+
+
+def make_system_spec(sizes: Dict[str, int]) -> Dict[str, Any]:
+    """Build a synthetic specification for AutoGenerationEngine.generate_complete_system"""
+
+    return {
+        'name': 'SYNTHETIC-GENERATED-SYSTEM',
+        'requirements': {
+            'scalability': 9,
+            'components': [f"component_{index}" for index in range(sizes['components'])]
+        },
+        'constraints': {'languages': ['python'], 'deployment': 'kubernetes'}
+    }
+
+
+def make_synthetic_repository(root: Path, name: str, sizes: Dict[str, int]) -> Path:
+    """Create a local bare git repository holding ``sizes['files']`` synthetic files"""
+
+    work_tree = root / f"{name}-work"
+    bare_repo = root / f"{name}.git"
+
+    for index in range(sizes['files']):
+        file_type = FILE_TYPES[index % len(FILE_TYPES)]
+        path = work_tree / f"src/module_{index // 20}" / f"file_{index}.{file_type}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# synthetic file {index} of {name}\n" + "value = 1\n" * 20)
+
+    git = ['git', '-c', 'user.name=benchmark', '-c', 'user.email=benchmark@localhost']
+    subprocess.run(git + ['init', '-q', str(work_tree)], check=True)
+    subprocess.run(git + ['-C', str(work_tree), 'add', '-A'], check=True)
+    subprocess.run(git + ['-C', str(work_tree), 'commit', '-q', '-m', 'synthetic'], check=True)
+    subprocess.run(git + ['clone', '-q', '--bare', str(work_tree), str(bare_repo)], check=True)
+
+    return bare_repo
+
+
+async def _time_call(fn: Callable[[], Awaitable[Any]], repeat: int, warmup: int) -> Dict[str, Any]:
+    """Time ``repeat`` awaited calls of ``fn`` after ``warmup`` untimed ones"""
+
+    for _ in range(warmup):
+        await fn()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+
+    return {
+        'repeat': repeat,
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'samples': samples
+    }
+
+
+def _open_merge_window(storm_engine) -> None:
+    """Put the merge window in the past so execute_perfect_merge never sleeps"""
+
+    storm_engine.merge_windows = [{
+        'timestamp': datetime.now() - timedelta(seconds=1),
+        'score': 5.0,
+        'intensity': 1.0
+    }]
+
+
+async def run_benchmarks(sizes: Dict[str, int], repeat: int = 5, warmup: int = 1,
+                         only: List[str] = None) -> Dict[str, Any]:
+    """Run the engine benchmarks against synthetic fixtures and return the results
+
+    Each benchmark builds its own engine (and fixtures) only when selected. A
+    benchmark that fails, while setting up or while running, is recorded as
+    ``{'status': 'error', 'error': ...}`` and the others still run.
+    """
+
+    systems = make_systems(sizes)
+    system_spec = make_system_spec(sizes)
+
+    with tempfile.TemporaryDirectory(prefix='storm-bench-') as fixture_root:
+
+        def clone_and_analyze_all_repos():
+            meta_ceo = load_engine('MetaRepositoryCEO')()
+            print(f"📦 Creating {sizes['repositories']} synthetic repositories...")
+            meta_ceo.base_repos = {
+                f"synthetic-repo-{index}": make_synthetic_repository(
+                    Path(fixture_root), f"synthetic-repo-{index}", sizes
+                ).as_uri()
+                for index in range(sizes['repositories'])
+            }
+            return meta_ceo.clone_and_analyze_all_repos
+
+        def merge_windows():
+            storm_engine = load_engine('PerfectStormMergeEngine')()
+
+            async def calculate():
+                storm_engine._calculate_optimal_merge_windows()
+            return calculate
+
+        def execute_perfect_merge():
+            storm_engine = load_engine('PerfectStormMergeEngine')()
+            _open_merge_window(storm_engine)
+            return lambda: storm_engine.execute_perfect_merge(systems)
+
+        def connect_all_systems():
+            cosmic_connector = load_engine('UniversalConnector')()
+            return lambda: cosmic_connector.connect_all_systems(systems)
+
+        def generate_complete_system():
+            generation_engine = load_engine('AutoGenerationEngine')()
+            return lambda: generation_engine.generate_complete_system(system_spec)
+
+        # name -> setup returning the coroutine function to time
+        benchmarks = {
+            'clone_and_analyze_all_repos': clone_and_analyze_all_repos,
+            'merge_windows': merge_windows,
+            'execute_perfect_merge': execute_perfect_merge,
+            'connect_all_systems': connect_all_systems,
+            'generate_complete_system': generate_complete_system
+        }
+
+        results = {}
+        for name, setup in benchmarks.items():
+            if only and name not in only:
+                continue
+            print(f"⏱️  Benchmarking {name}...")
+            try:
+                results[name] = {'status': 'ok', **await _time_call(setup(), repeat, warmup)}
+            except Exception as error:
+                results[name] = {'status': 'error', 'error': repr(error)}
+                print(f"   ❌ {error!r}")
+                continue
+            print(f"   median {results[name]['median'] * 1000:.2f}ms  min {results[name]['min'] * 1000:.2f}ms")
+
+    return {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'repeat': repeat,
+            'warmup': warmup
+        },
+        'benchmarks': results
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> Dict[str, Any]:
+    """Compare benchmark medians against a stored baseline and flag regressions
+
+    A benchmark that errors now but was timed in the baseline is ``broken`` and
+    counts as a regression; other errored benchmarks are only reported.
+
+    Raises ValueError when the baseline was recorded with different fixture
+    sizes, since its medians are then not comparable.
+    """
+
+    if current['metadata']['sizes'] != baseline['metadata']['sizes']:
+        raise ValueError(
+            f"fixture sizes {current['metadata']['sizes']} differ from the baseline's "
+            f"{baseline['metadata']['sizes']}"
+        )
+
+    comparison = {}
+    for name, result in current['benchmarks'].items():
+        baseline_result = baseline['benchmarks'].get(name)
+        baseline_timed = baseline_result is not None and baseline_result.get('status', 'ok') == 'ok'
+
+        if result.get('status', 'ok') == 'error':
+            comparison[name] = {'status': 'broken' if baseline_timed else 'error', 'error': result['error']}
+            continue
+        if not baseline_timed:
+            comparison[name] = {'status': 'new', 'current': result['median']}
+            continue
+
+        baseline_median = baseline_result['median']
+        ratio = result['median'] / baseline_median if baseline_median else float('inf')
+        if ratio > 1.0 + threshold:
+            status = 'regression'
+        elif ratio < 1.0 - threshold:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+
+        comparison[name] = {
+            'status': status,
+            'baseline': baseline_median,
+            'current': result['median'],
+            'ratio': ratio
+        }
+
+    return {
+        'threshold': threshold,
+        'benchmarks': comparison,
+        'regressions': [name for name, entry in comparison.items() if entry['status'] in ('regression', 'broken')],
+        'errors': [name for name, entry in comparison.items() if entry['status'] in ('error', 'broken')]
+    }
+
+
+def _print_comparison(comparison: Dict[str, Any]):
+    for name, entry in comparison['benchmarks'].items():
+        if entry['status'] in ('error', 'broken'):
+            print(f"   {name:<28} {entry['status']:<10} {entry['error']}")
+        elif entry['status'] == 'new':
+            print(f"   {name:<28} new        {entry['current'] * 1000:9.2f}ms")
+        else:
+            print(f"   {name:<28} {entry['status']:<10} {entry['baseline'] * 1000:9.2f}ms -> "
+                  f"{entry['current'] * 1000:9.2f}ms ({entry['ratio']:.2f}x)")
+
+    if comparison['regressions']:
+        print(f"❌ REGRESSIONS: {', '.join(comparison['regressions'])}")
+    else:
+        print("✅ NO REGRESSIONS")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the ULTIMATE-META-SYSTEM engines.')
+    for size, default in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{size}", type=int, default=default, help=f"fixture size (default {default})")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--only', action='append', help='run only this benchmark (repeatable)')
+    parser.add_argument('-o', '--output', type=Path, help='write the results as JSON')
+    parser.add_argument('--baseline', type=Path,
+                        help='compare against a stored results JSON; exit 1 on regressions or newly '
+                             'broken benchmarks, 2 if it used different fixture sizes')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    sizes = {size: getattr(args, size) for size in DEFAULT_SIZES}
+    results = asyncio.run(run_benchmarks(sizes, args.repeat, args.warmup, args.only))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"💾 Results written to {args.output}")
+
+    if args.baseline:
+        try:
+            comparison = compare_results(results, json.loads(args.baseline.read_text()), args.threshold)
+        except ValueError as error:
+            # Distinct from 1 (regressions): the comparison itself is invalid
+            print(f"⚠️  CANNOT COMPARE WITH {args.baseline}: {error}")
+            return 2
+        _print_comparison(comparison)
+        return 1 if comparison['regressions'] else 0
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,12 @@
 # /workspace/ULTIMATE-META-SYSTEM/evolution-engine/self_improvement.py
 
+import asyncio
+from typing import Dict, List, Any
+
+from instrumentation import count, get_logger, span
+
+log = get_logger('self_improvement')
+
 class SelfImprovementEngine:
     """ENGINE THAT MAKES THE SYSTEM CONTINUOUSLY IMPROVE ITSELF"""
     
@@ -11,32 +18,41 @@ class SelfImprovementEngine:
     async def continuous_self_improvement_loop(self):
         """Main loop for continuous self-improvement"""
         
-        print("🔄 STARTING CONTINUOUS SELF-IMPROVEMENT LOOP...")
+        log.info("🔄 STARTING CONTINUOUS SELF-IMPROVEMENT LOOP...")
         
         while True:
             self.improvement_cycles += 1
-            print(f"🔄 IMPROVEMENT CYCLE {self.improvement_cycles}")
-            
-            # Step 1: Performance Analysis
-            current_performance = await self._analyze_current_performance()
-            self.performance_metrics[self.improvement_cycles] = current_performance
-            
-            # Step 2: Identify Improvement Opportunities
-            opportunities = await self._identify_improvement_opportunities(current_performance)
-            
-            # Step 3: Generate Improvements
-            improvements = await self._generate_improvements(opportunities)
-            
-            # Step 4: Test Improvements
-            tested_improvements = await self._test_improvements(improvements)
-            
-            # Step 5: Deploy Improvements
-            await self._deploy_improvements(tested_improvements)
+            log.info("🔄 IMPROVEMENT CYCLE %d", self.improvement_cycles)
             
-            # Step 6: Learn from Results
-            await self._learn_from_improvement_cycle(tested_improvements)
+            with span('improvement.cycle', cycle=self.improvement_cycles):
+                # Step 1: Performance Analysis
+                with span('improvement.analyze'):
+                    current_performance = await self._analyze_current_performance()
+                self.performance_metrics[self.improvement_cycles] = current_performance
+                
+                # Step 2: Identify Improvement Opportunities
+                with span('improvement.identify'):
+                    opportunities = await self._identify_improvement_opportunities(current_performance)
+                
+                # Step 3: Generate Improvements
+                with span('improvement.generate'):
+                    improvements = await self._generate_improvements(opportunities)
+                
+                # Step 4: Test Improvements
+                with span('improvement.test'):
+                    tested_improvements = await self._test_improvements(improvements)
+                
+                # Step 5: Deploy Improvements
+                with span('improvement.deploy'):
+                    await self._deploy_improvements(tested_improvements)
+                
+                # Step 6: Learn from Results
+                with span('improvement.learn'):
+                    await self._learn_from_improvement_cycle(tested_improvements)
+            count('improvement.cycles')
+            count('improvement.deployed', len(tested_improvements))
             
-            print(f"✅ CYCLE {self.improvement_cycles} COMPLETED - {len(tested_improvements)} IMPROVEMENTS DEPLOYED")
+            log.info("✅ CYCLE %d COMPLETED - %d IMPROVEMENTS DEPLOYED", self.improvement_cycles, len(tested_improvements))
             
             # Wait for next cycle (shorter wait as system gets smarter)
             wait_time = max(300, 3600 / (self.improvement_cycles ** 0.5))  # Exponential acceleration
@@ -82,7 +98,7 @@ class SelfImprovementEngine:
         improvements = []
         
         for opportunity in opportunities:
-            print(f"   🔧 Generating improvement for: {opportunity['description']}")
+            log.debug("   🔧 Generating improvement for: %s", opportunity['description'])
             
             if opportunity['type'] == 'code_optimization':
                 improvement = await self._generate_code_improvement(opportunity)
@@ -0,0 +1,405 @@
+# /workspace/ULTIMATE-META-SYSTEM/artifact_store.py
+
+"""Content-addressed artifact store shared by every engine and pool worker
+
+Artifacts (analysis dicts, capability lists, fused architectures, integration
+code, generated codebases) are serialized with pickle protocol 5. Out-of-band
+buffers are stored separately and aligned, so reads map them straight from the
+blob with mmap instead of copying. Each blob is named by the SHA-256 of its
+bytes and reference counted in a small JSON index. A deployment owns its
+references through a run; ``gc`` releases old runs and deletes unreferenced
+blobs. Engines pass around ``ArtifactRef`` objects, which pickle to a key and
+a store path, so any worker process can load them.
+"""
+
+import fcntl
+import functools
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List
+
+DEFAULT_STORE_ROOT = Path('/workspace/.storm-artifacts')
+
+# Blobs without an index entry are only collected once they are this old, so
+# a live run can write them before its flush records the references
+DEFAULT_ORPHAN_GRACE_SECONDS = 3600
+
+_MAGIC = b'STORMART'
+_HEADER = struct.Struct('>II')  # pickle length, number of out-of-band buffers
+_BUFFER_LENGTH = struct.Struct('>Q')
+_ALIGNMENT = 64
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def _encode(obj: Any) -> List[bytes]:
+    """Serialize ``obj`` into the chunks of one blob"""
+
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    header = _MAGIC + _HEADER.pack(len(payload), len(raw_buffers)) + b"".join(
+        _BUFFER_LENGTH.pack(raw.nbytes) for raw in raw_buffers
+    )
+    chunks = [header, b"\0" * _padding(len(header)), payload]
+    offset = len(header) + _padding(len(header)) + len(payload)
+    for raw in raw_buffers:
+        chunks.append(b"\0" * _padding(offset))
+        offset += _padding(offset)
+        chunks.append(raw)
+        offset += raw.nbytes
+
+    return chunks
+
+
+def _decode(blob: memoryview) -> Any:
+    """Deserialize a blob; out-of-band buffers stay views into ``blob``"""
+
+    if bytes(blob[:len(_MAGIC)]) != _MAGIC:
+        raise ValueError("not an artifact blob")
+
+    offset = len(_MAGIC)
+    payload_length, buffer_count = _HEADER.unpack_from(blob, offset)
+    offset += _HEADER.size
+    buffer_lengths = [
+        _BUFFER_LENGTH.unpack_from(blob, offset + index * _BUFFER_LENGTH.size)[0]
+        for index in range(buffer_count)
+    ]
+    offset += buffer_count * _BUFFER_LENGTH.size
+    offset += _padding(offset)
+
+    payload = blob[offset:offset + payload_length]
+    offset += payload_length
+
+    buffers = []
+    for length in buffer_lengths:
+        offset += _padding(offset)
+        buffers.append(blob[offset:offset + length])
+        offset += length
+
+    return pickle.loads(payload, buffers=buffers)
+
+
+def _encode_keyed(obj: Any):
+    """Content key and blob chunks of ``obj``"""
+
+    chunks = _encode(obj)
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest(), chunks
+
+
+class ArtifactRef:
+    """Handle to a stored artifact; cheap to copy and to send to workers"""
+
+    __slots__ = ('key', 'store_root')
+
+    def __init__(self, key: str, store_root: str):
+        self.key = key
+        self.store_root = str(store_root)
+
+    def load(self) -> Any:
+        return open_store(self.store_root).get(self.key)
+
+    def __reduce__(self):
+        return (ArtifactRef, (self.key, self.store_root))
+
+    def __eq__(self, other):
+        return isinstance(other, ArtifactRef) and (self.key, self.store_root) == (other.key, other.store_root)
+
+    def __hash__(self):
+        return hash((self.key, self.store_root))
+
+    def __repr__(self):
+        return f"ArtifactRef({self.key[:12]})"
+
+
+class ArtifactStore:
+    """Blobs under ``objects/``, reference counts and runs in ``index.json``
+
+    References are owned either by the caller of ``put`` (released with
+    ``decref``) or by a run (see ``run``): every reference a run takes is
+    recorded under it, and ``release_run`` / ``gc(keep_runs=...)`` drop them
+    all at once, so a deployment's artifacts live until a newer one replaces it.
+    """
+
+    def __init__(self, root: Path = DEFAULT_STORE_ROOT):
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.index_path = self.root / 'index.json'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    def _blob_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / key[2:]
+
+    def _read_index(self) -> Dict[str, Any]:
+        index = json.loads(self.index_path.read_text()) if self.index_path.exists() else {}
+        if 'artifacts' not in index:
+            # Indexes written before runs existed map keys to entries directly
+            index = {'artifacts': index, 'runs': {}}
+        return index
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive store lock (safe across processes), held by every blob write and gc"""
+
+        with open(self.root / 'index.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _locked_index(self):
+        """Read-modify-write the index under the store lock"""
+
+        with self._locked():
+            index = self._read_index()
+            yield index
+            self._write_atomically(self.index_path, [json.dumps(index, sort_keys=True).encode()])
+
+    def _write_atomically(self, path: Path, chunks: List[bytes]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(prefix='.tmp-', dir=path.parent)
+        try:
+            with os.fdopen(descriptor, 'wb') as handle:
+                handle.writelines(chunks)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def _reference(self, index: Dict[str, Any], key: str, chunks: List[bytes], kind: str,
+                   refs: int = 1, run_id: str = None):
+        """Take ``refs`` references to blob ``key``; the caller holds the index lock
+
+        The blob is checked and written under the lock, otherwise a concurrent
+        gc could delete an existing unreferenced blob before it is referenced.
+        """
+
+        blob_path = self._blob_path(key)
+        if not blob_path.exists():
+            self._write_atomically(blob_path, chunks)
+
+        entry = index['artifacts'].setdefault(key, {
+            'refs': 0,
+            'size': sum(len(chunk) for chunk in chunks),
+            'kind': kind,
+            'created': time.time()
+        })
+        entry['refs'] += refs
+
+        if run_id is not None:
+            run_keys = index['runs'][run_id]['keys']
+            run_keys[key] = run_keys.get(key, 0) + refs
+
+    def put(self, obj: Any, kind: str = None) -> ArtifactRef:
+        """Store ``obj`` (deduplicated by content) and take one reference to it"""
+
+        key, chunks = _encode_keyed(obj)
+        with self._locked_index() as index:
+            self._reference(index, key, chunks, kind or type(obj).__name__)
+
+        return ArtifactRef(key, self.root)
+
+    def flush(self):
+        """Nothing to do: ``put`` updates the index immediately (see ArtifactRun)"""
+
+    def get(self, key: str) -> Any:
+        """Load an artifact through a read-only memory map of its blob"""
+
+        with open(self._blob_path(key), 'rb') as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        # The map stays alive as long as any decoded buffer view references it
+        return _decode(memoryview(mapped))
+
+    def contains(self, key: str) -> bool:
+        return self._blob_path(key).exists()
+
+    def incref(self, key: str):
+        with self._locked_index() as index:
+            if key not in index['artifacts']:
+                raise KeyError(key)
+            index['artifacts'][key]['refs'] += 1
+
+    def decref(self, key: str):
+        with self._locked_index() as index:
+            if key not in index['artifacts']:
+                raise KeyError(key)
+            index['artifacts'][key]['refs'] = max(0, index['artifacts'][key]['refs'] - 1)
+
+    def run(self, run_id: str = None) -> 'ArtifactRun':
+        """Start a run owning every reference taken through it"""
+
+        run_id = run_id or f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{os.urandom(3).hex()}"
+        with self._locked_index() as index:
+            if run_id in index['runs']:
+                raise ValueError(f"artifact run {run_id} already exists")
+            index['runs'][run_id] = {'created': time.time(), 'keys': {}}
+
+        return ArtifactRun(self, run_id)
+
+    def _release_run(self, index: Dict[str, Any], run_id: str):
+        for key, refs in index['runs'].pop(run_id)['keys'].items():
+            if key in index['artifacts']:
+                index['artifacts'][key]['refs'] = max(0, index['artifacts'][key]['refs'] - refs)
+
+    def release_run(self, run_id: str):
+        """Drop every reference owned by run ``run_id``"""
+
+        with self._locked_index() as index:
+            if run_id not in index['runs']:
+                raise KeyError(run_id)
+            self._release_run(index, run_id)
+
+    def gc(self, keep_runs: int = None,
+           orphan_grace_seconds: float = DEFAULT_ORPHAN_GRACE_SECONDS) -> Dict[str, int]:
+        """Delete every blob whose reference count dropped to zero
+
+        With ``keep_runs``, every run except the newest ``keep_runs`` is
+        released first. Files under ``objects/`` without an index entry (blobs
+        of a run killed before its flush, interrupted writes) are deleted once
+        older than ``orphan_grace_seconds``.
+        """
+
+        removed = 0
+        freed = 0
+        released = 0
+        orphans = 0
+        with self._locked_index() as index:
+            if keep_runs is not None:
+                by_age = sorted(index['runs'], key=lambda run_id: index['runs'][run_id]['created'], reverse=True)
+                for run_id in by_age[keep_runs:]:
+                    self._release_run(index, run_id)
+                    released += 1
+
+            artifacts = index['artifacts']
+            for key in [key for key, entry in artifacts.items() if entry['refs'] <= 0]:
+                self._blob_path(key).unlink(missing_ok=True)
+                freed += artifacts.pop(key)['size']
+                removed += 1
+
+            cutoff = time.time() - orphan_grace_seconds
+            for path in self.objects_dir.glob('*/*'):
+                if path.parent.name + path.name in artifacts:
+                    continue
+                stat = path.stat()
+                if stat.st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+                    freed += stat.st_size
+                    orphans += 1
+
+        return {'removed': removed, 'freed_bytes': freed, 'released_runs': released, 'orphans': orphans}
+
+    def stats(self) -> Dict[str, int]:
+        index = self._read_index()
+        artifacts = index['artifacts']
+        return {
+            'artifacts': len(artifacts),
+            'bytes': sum(entry['size'] for entry in artifacts.values()),
+            'unreferenced': sum(1 for entry in artifacts.values() if entry['refs'] <= 0),
+            'runs': len(index['runs'])
+        }
+
+
+class ArtifactRun:
+    """Store handle whose references all belong to one run (e.g. one deployment)
+
+    Engines use it exactly like an ArtifactStore. ``put`` writes the blob
+    right away but only buffers the reference; ``flush`` records every
+    buffered reference in one locked index update, so engines putting one
+    artifact per item flush once per call instead of rewriting the index
+    per item. A ref returned by ``put`` is only guaranteed to stay loadable
+    after ``flush``: until then a concurrent gc may delete a blob it already
+    knew as unreferenced (flush writes it back). The run's artifacts stay
+    referenced until ``ArtifactStore.release_run`` or ``gc(keep_runs=...)``.
+    """
+
+    def __init__(self, store: ArtifactStore, run_id: str):
+        self.store = store
+        self.run_id = run_id
+        self.root = store.root
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def put(self, obj: Any, kind: str = None) -> ArtifactRef:
+        """Store ``obj`` and buffer a reference owned by this run"""
+
+        key, chunks = _encode_keyed(obj)
+        blob_path = self.store._blob_path(key)
+        with self.store._locked():
+            if blob_path.exists():
+                # Keeps an unindexed blob inside gc's orphan grace period
+                os.utime(blob_path)
+            else:
+                self.store._write_atomically(blob_path, chunks)
+
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                # The chunks are kept so flush can rewrite a blob that a
+                # concurrent gc deleted before the reference was recorded
+                self._pending[key] = [1, chunks, kind or type(obj).__name__]
+            else:
+                pending[0] += 1
+
+        return ArtifactRef(key, self.root)
+
+    def flush(self):
+        """Record every buffered reference under this run"""
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        with self.store._locked_index() as index:
+            for key, (refs, chunks, kind) in pending.items():
+                self.store._reference(index, key, chunks, kind, refs, run_id=self.run_id)
+
+    def get(self, key: str) -> Any:
+        return self.store.get(key)
+
+    def release(self):
+        self.flush()
+        self.store.release_run(self.run_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def open_store(root: str = str(DEFAULT_STORE_ROOT)) -> ArtifactStore:
+    """Per-process store for ``root``, shared by every ArtifactRef that points there"""
+
+    return ArtifactStore(Path(root))
+
+
+def resolve(value: Any) -> Any:
+    """Load ``value`` if it is an ArtifactRef, otherwise return it unchanged"""
+
+    return value.load() if isinstance(value, ArtifactRef) else value
+
+
+def resolve_all(artifacts: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve every value of a name -> artifact (or ArtifactRef) mapping"""
+
+    return {name: resolve(value) for name, value in artifacts.items()}
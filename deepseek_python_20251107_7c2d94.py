@@ -0,0 +1,271 @@
+# /workspace/ULTIMATE-META-SYSTEM/micro_benchmark.py
+
+"""Micro-benchmark harness used by the merge to measure real performance
+
+A workload is any zero-argument callable (sync or async) exercising one
+system. ``measure_workload`` runs it in timed rounds and reports throughput
+and latency percentiles, each with a bootstrap confidence interval.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_BENCHMARK_CONFIG = {
+    'warmup': 10,               # untimed calls before the first round
+    'iterations': 200,          # timed calls per round
+    'rounds': 5,                # throughput is measured once per round
+    'confidence': 0.95,         # confidence level of every interval
+    'bootstrap_samples': 1000,  # resamples per confidence interval
+    'seed': 0                   # keeps the intervals reproducible
+}
+
+# Numeric service-level objectives for the merged system; None disables a check
+DEFAULT_SLOS = {
+    'min_throughput_per_second': None,
+    'max_latency_p99_seconds': None,
+    'min_performance_gain': 1.0
+}
+
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+class SLOViolation(Exception):
+    """The merged system missed one or more of its service-level objectives"""
+
+    def __init__(self, violations: List[str], measurement: Dict[str, Any]):
+        super().__init__("; ".join(violations))
+        self.violations = violations
+        self.measurement = measurement
+
+
+def default_workload_factory(system_name: str, system_data: Any) -> Optional[Callable[[], Any]]:
+    """Use the ``workload`` callable a system carries, if any"""
+
+    if isinstance(system_data, dict) and callable(system_data.get('workload')):
+        return system_data['workload']
+    return None
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    """Linear-interpolated percentile of an already sorted list"""
+
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * percentile / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _bootstrap_interval(values: List[float], statistic: Callable[[List[float]], float],
+                        config: Dict[str, Any], rng: random.Random) -> Dict[str, float]:
+    """Point estimate plus percentile-bootstrap confidence interval of ``statistic``"""
+
+    estimates = sorted(
+        statistic(sorted(rng.choices(values, k=len(values))))
+        for _ in range(config['bootstrap_samples'])
+    )
+    tail = (1.0 - config['confidence']) / 2.0 * 100.0
+
+    return {
+        'value': statistic(sorted(values)),
+        'ci_low': _percentile(estimates, tail),
+        'ci_high': _percentile(estimates, 100.0 - tail)
+    }
+
+
+def _timed_rounds(call: Callable[[], Any], config: Dict[str, Any]):
+    """Latency of every call and throughput of every round for a sync ``call``"""
+
+    latencies = []
+    round_throughputs = []
+    for _ in range(config['rounds']):
+        round_started = time.perf_counter()
+        for _ in range(config['iterations']):
+            started = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - started)
+        round_throughputs.append(config['iterations'] / (time.perf_counter() - round_started))
+
+    return latencies, round_throughputs
+
+
+def _summarize(latencies: List[float], round_throughputs: List[float], config: Dict[str, Any]) -> Dict[str, Any]:
+    rng = random.Random(config['seed'])
+    return {
+        'throughput_per_second': _bootstrap_interval(round_throughputs, statistics.fmean, config, rng),
+        'latency_seconds': {
+            f"p{percentile}": _bootstrap_interval(
+                latencies, lambda values, p=percentile: _percentile(values, p), config, rng
+            )
+            for percentile in LATENCY_PERCENTILES
+        },
+        'samples': len(latencies),
+        'config': config
+    }
+
+
+async def measure_workload(workload: Callable[[], Any], config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Measure throughput (calls/s) and latency percentiles (s) of ``workload``
+
+    Sync workloads and the bootstrap run in a worker thread, so measuring never
+    blocks the event loop; async workloads are awaited on the loop.
+    """
+
+    config = {**DEFAULT_BENCHMARK_CONFIG, **(config or {})}
+
+    def awaitable(result):
+        return asyncio.iscoroutine(result) or isinstance(result, asyncio.Future)
+
+    # A plain callable may still return a coroutine; its first (untimed) call decides
+    is_async = asyncio.iscoroutinefunction(workload)
+    warmup = config['warmup']
+    if not is_async:
+        result = await asyncio.to_thread(workload)
+        is_async = awaitable(result)
+        if is_async:
+            await result
+        warmup = max(0, warmup - 1)
+
+    if is_async:
+        async def call():
+            result = workload()
+            if awaitable(result):
+                await result
+
+        for _ in range(warmup):
+            await call()
+
+        latencies = []
+        round_throughputs = []
+        for _ in range(config['rounds']):
+            round_started = time.perf_counter()
+            for _ in range(config['iterations']):
+                started = time.perf_counter()
+                await call()
+                latencies.append(time.perf_counter() - started)
+            round_throughputs.append(config['iterations'] / (time.perf_counter() - round_started))
+    else:
+        def run():
+            for _ in range(warmup):
+                workload()
+            return _timed_rounds(workload, config)
+
+        latencies, round_throughputs = await asyncio.to_thread(run)
+
+    return await asyncio.to_thread(_summarize, latencies, round_throughputs, config)
+
+
+def _code_digest(code, digest):
+    digest.update(code.co_code)
+    for constant in code.co_consts:
+        if hasattr(constant, 'co_code'):
+            _code_digest(constant, digest)
+        elif isinstance(constant, frozenset):
+            # Set iteration order depends on PYTHONHASHSEED
+            digest.update(repr(sorted(repr(item) for item in constant)).encode())
+        else:
+            digest.update(repr(constant).encode())
+
+
+def _callable_identity(value: Callable) -> str:
+    """Stable identity of a workload: where it is defined and what its code does
+
+    Every lambda shares the qualified name ``<lambda>``, so the bytecode and
+    constants are hashed too. A ``workload_version`` attribute on the callable
+    is included for changes the code alone does not show (e.g. captured
+    variables or fixture data).
+    """
+
+    function = getattr(value, '__func__', value)
+    code = getattr(function, '__code__', None)
+    digest = hashlib.sha256()
+    if code is not None:
+        _code_digest(code, digest)
+
+    return ":".join(str(part) for part in (
+        getattr(function, '__module__', None),
+        getattr(function, '__qualname__', None) or type(function).__qualname__,
+        digest.hexdigest() if code is not None else None,
+        getattr(value, 'workload_version', None)
+    ))
+
+
+def system_fingerprint(system_name: str, system_data: Any, config: Dict[str, Any],
+                       workload: Callable[[], Any] = None) -> str:
+    """Cache key for a system's baseline: changes with its data, workload or the benchmark config"""
+
+    # Workload callables are keyed by code identity so the key survives restarts
+    payload = json.dumps(
+        [system_name, system_data, config, workload], sort_keys=True,
+        default=lambda value: _callable_identity(value) if callable(value) else repr(value)
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class BaselineCache:
+    """Baseline measurements per source system, optionally persisted as JSON"""
+
+    def __init__(self, path: Path = None):
+        self.path = Path(path) if path else None
+        self._entries = {}
+        if self.path and self.path.exists():
+            self._entries = json.loads(self.path.read_text())
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(fingerprint)
+
+    def put(self, fingerprint: str, measurement: Dict[str, Any]):
+        self._entries[fingerprint] = measurement
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._entries, indent=2))
+
+
+def check_slos(measurement: Optional[Dict[str, Any]], performance_gain: Optional[Dict[str, float]],
+               slos: Dict[str, Any]) -> List[str]:
+    """Return a description of every violated SLO (empty when all are met)
+
+    Throughput, latency and ``performance_gain`` (value plus ``ci_low`` /
+    ``ci_high``) only count as violated when the whole confidence interval
+    misses the target, so measurement noise alone cannot fail a merge. The gain
+    check is skipped while the gain is unmeasured.
+    """
+
+    violations = []
+    checks_need_measurement = any(
+        slos.get(name) is not None for name in ('min_throughput_per_second', 'max_latency_p99_seconds')
+    )
+    if measurement is None:
+        if checks_need_measurement:
+            violations.append("merged system has no workload to measure")
+        return violations
+
+    throughput = measurement['throughput_per_second']
+    latency_p99 = measurement['latency_seconds']['p99']
+
+    if slos.get('min_throughput_per_second') is not None \
+            and throughput['ci_high'] < slos['min_throughput_per_second']:
+        violations.append(
+            f"throughput {throughput['value']:.1f}/s below {slos['min_throughput_per_second']}/s"
+        )
+    if slos.get('max_latency_p99_seconds') is not None \
+            and latency_p99['ci_low'] > slos['max_latency_p99_seconds']:
+        violations.append(
+            f"p99 latency {latency_p99['value'] * 1000:.3f}ms above "
+            f"{slos['max_latency_p99_seconds'] * 1000:.3f}ms"
+        )
+    if slos.get('min_performance_gain') is not None and performance_gain is not None \
+            and performance_gain['ci_high'] < slos['min_performance_gain']:
+        violations.append(
+            f"performance gain {performance_gain['value']:.2f}x "
+            f"(at most {performance_gain['ci_high']:.2f}x) below {slos['min_performance_gain']}x"
+        )
+
+    return violations
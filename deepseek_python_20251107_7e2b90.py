@@ -0,0 +1,157 @@
+# /workspace/ULTIMATE-META-SYSTEM/tests/test_meta_repository.py
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+if not (SYSTEM_ROOT / 'deploy_perfect_storm.py').exists():
+    pytest.skip("deploy_perfect_storm.py is not laid out under the system root", allow_module_level=True)
+if shutil.which('git') is None:
+    pytest.skip("git is needed to check the generated repositories", allow_module_level=True)
+if str(SYSTEM_ROOT) not in sys.path:
+    sys.path.insert(0, str(SYSTEM_ROOT))
+
+from deploy_perfect_storm import load_engine
+
+MetaRepositoryCEO = load_engine('MetaRepositoryCEO')
+meta_ceo_module = sys.modules[MetaRepositoryCEO.__module__]
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ['git', '-C', str(repo), '-c', 'user.name=test', '-c', 'user.email=test@localhost', *args],
+        capture_output=True, text=True, check=True
+    ).stdout
+
+
+def create(target: Path, version: int = 1) -> dict:
+    structure = {'name': target.name, 'purpose': 'tests', 'structure': {'version': version}}
+    MetaRepositoryCEO()._create_meta_repository(structure, target)
+    return structure
+
+
+def assert_clean_repository(repo: Path):
+    git(repo, 'fsck', '--strict')
+    assert git(repo, 'status', '--porcelain') == ''
+
+
+def leftovers(target: Path):
+    return [path.name for path in target.parent.iterdir() if path.name != target.name]
+
+
+def test_initial_commit_is_valid_and_clean(tmp_path):
+    target = tmp_path / 'META'
+    structure = create(target)
+
+    assert_clean_repository(target)
+    assert git(target, 'rev-parse', 'HEAD').strip() == structure['commit']
+    assert git(target, 'log', '--format=%an <%ae>').strip() == meta_ceo_module.GIT_AUTHOR
+    assert sorted(git(target, 'ls-files').split()) == sorted(
+        ['.meta/manifest.json', '.meta/structure.json', 'README.md', 'meta-repository.json']
+    )
+    assert leftovers(target) == []
+
+
+def test_tree_order_matches_git(tmp_path):
+    # git sorts a subtree as if its name ended in '/', so 'a.b' < 'a/' < 'a0'
+    files = {'a.b': b'1\n', 'a/x': b'2\n', 'a0': b'3\n', 'a-c/y/z': b'4\n', 'b': b''}
+    for path, content in files.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_bytes(content)
+
+    meta_ceo_module._write_initial_git_commit(tmp_path, files, "ordering")
+
+    assert_clean_repository(tmp_path)
+    assert sorted(git(tmp_path, 'ls-files').split()) == sorted(files)
+
+
+def test_unchanged_manifest_is_a_no_op(tmp_path):
+    target = tmp_path / 'META'
+    first = create(target)
+    head = git(target, 'rev-parse', 'HEAD')
+
+    second = create(target)
+
+    assert second['unchanged'] is True
+    assert second['manifest_hash'] == first['manifest_hash']
+    assert git(target, 'rev-parse', 'HEAD') == head
+
+
+def test_changed_content_replaces_pristine_repository(tmp_path):
+    target = tmp_path / 'META'
+    first = create(target, version=1)
+
+    second = create(target, version=2)
+
+    assert second['unchanged'] is False
+    assert second['commit'] != first['commit']
+    assert_clean_repository(target)
+    assert leftovers(target) == []
+
+
+def test_replaces_without_exchange_support(tmp_path, monkeypatch):
+    target = tmp_path / 'META'
+    create(target, version=1)
+    monkeypatch.setattr(meta_ceo_module, '_exchange_paths', lambda source, destination: False)
+
+    create(target, version=2)
+
+    assert_clean_repository(target)
+    assert leftovers(target) == []
+
+
+def test_empty_target_is_replaced(tmp_path):
+    target = tmp_path / 'META'
+    target.mkdir()
+
+    create(target)
+
+    assert_clean_repository(target)
+
+
+@pytest.mark.parametrize('change', ['modified', 'untracked', 'commit', 'branch', 'foreign'])
+def test_refuses_to_replace_local_work(tmp_path, change):
+    target = tmp_path / 'META'
+    if change == 'foreign':
+        target.mkdir()
+        (target / 'notes.txt').write_text("not generated\n")
+    else:
+        create(target, version=1)
+        if change == 'modified':
+            (target / 'README.md').write_text("edited\n")
+        elif change == 'untracked':
+            (target / 'notes.txt').write_text("mine\n")
+        elif change == 'commit':
+            (target / 'README.md').write_text("edited\n")
+            git(target, 'commit', '-qam', 'local change')
+            (target / 'README.md').write_bytes(git(target, 'show', 'HEAD~1:README.md').encode())
+            git(target, 'commit', '-qam', 'revert local change')
+        elif change == 'branch':
+            git(target, 'branch', 'work')
+    snapshot = sorted(str(path.relative_to(target)) for path in target.rglob('*'))
+
+    with pytest.raises(meta_ceo_module.MetaRepositoryConflict):
+        create(target, version=2)
+
+    assert sorted(str(path.relative_to(target)) for path in target.rglob('*')) == snapshot
+    assert leftovers(target) == []
+
+
+def test_interrupted_swap_is_recovered(tmp_path):
+    target = tmp_path / 'META'
+    first = create(target)
+    # Crash between the two renames of the fallback swap
+    retired = tmp_path / '.META.old-crashed'
+    retired.mkdir()
+    os.rename(target, retired / target.name)
+
+    again = create(target)
+
+    assert again['unchanged'] is True
+    assert git(target, 'rev-parse', 'HEAD').strip() == first['commit']
+    assert leftovers(target) == []
@@ -5,11 +5,28 @@ import asyncio
 import subprocess
 import sys
 import os
+import hashlib
+import shutil
+import struct
+import tempfile
+import time
+import zlib
 from pathlib import Path
-from typing import Dict, List, Any
-import yaml
+from typing import TYPE_CHECKING, Dict, List, Any
 import json
 
+from instrumentation import count, get_logger, span, traced
+
+log = get_logger('meta_ceo')
+
+if TYPE_CHECKING:
+    from artifact_store import ArtifactStore
+
+
+class MetaRepositoryConflict(Exception):
+    """The target directory holds work that regenerating it would destroy"""
+
+
 class MetaRepositoryCEO:
     """THE ULTIMATE SYSTEM THAT BUILDS SYSTEMS - Meta-Repository Orchestrator"""
     
@@ -30,6 +47,12 @@ class MetaRepositoryCEO:
         }
         
         self.meta_architecture = self._initialize_meta_architecture()
+        
+        # Where generate_meta_repository materializes new repositories
+        self.meta_repository_root = Path('/workspace')
+        
+        # When set, analyses are published to the store and returned by reference
+        self.artifact_store: 'ArtifactStore' = None
     
     def _initialize_meta_architecture(self) -> Dict[str, Any]:
         """Initialize the meta-architecture that creates architectures"""
@@ -65,23 +88,41 @@ class MetaRepositoryCEO:
         }
     
     async def clone_and_analyze_all_repos(self):
-        """Clone ALL repositories and perform deep analysis"""
-        print("🔍 CLONING AND ANALYZING ENTIRE GITHUB ECOSYSTEM...")
+        """Clone ALL repositories and perform deep analysis
+        
+        With an artifact store configured the values are ArtifactRefs, which the
+        merge engine and the connector resolve themselves.
+        """
+        log.info("🔍 CLONING AND ANALYZING ENTIRE GITHUB ECOSYSTEM...")
         
         analysis_results = {}
         
         for repo_name, repo_url in self.base_repos.items():
-            print(f"📥 Cloning {repo_name} from {repo_url}")
+            log.info("📥 Cloning %s from %s", repo_name, repo_url)
             
             # Clone repository
-            clone_result = await self._clone_repository(repo_name, repo_url)
-            analysis_results[repo_name] = await self._deep_analyze_repository(repo_name)
+            with span('analyze.clone', repo=repo_name):
+                clone_result = await self._clone_repository(repo_name, repo_url)
+            with span('analyze.deep_analysis', repo=repo_name):
+                analysis = await self._deep_analyze_repository(repo_name)
             
             # Extract every capability and pattern
-            capabilities = self._extract_capabilities(analysis_results[repo_name])
-            patterns = self._extract_design_patterns(analysis_results[repo_name])
+            with span('analyze.extract', repo=repo_name):
+                capabilities = self._extract_capabilities(analysis)
+                patterns = self._extract_design_patterns(analysis)
             
-            print(f"✅ {repo_name}: {len(capabilities)} capabilities, {len(patterns)} patterns")
+            if self.artifact_store is not None:
+                analysis_results[repo_name] = self.artifact_store.put(analysis, kind='analysis')
+            else:
+                analysis_results[repo_name] = analysis
+            count('analyze.repositories')
+            count('analyze.capabilities', len(capabilities))
+            
+            log.info("✅ %s: %d capabilities, %d patterns", repo_name, len(capabilities), len(patterns))
+        
+        if self.artifact_store is not None:
+            # One index update for every analysis stored above
+            self.artifact_store.flush()
         
         return analysis_results
     
@@ -106,7 +147,7 @@ class MetaRepositoryCEO:
         capabilities = []
         
         # Extract from file structure
-        for file_type, count in analysis['file_structure']['file_types'].items():
+        for file_type, file_count in analysis['file_structure']['file_types'].items():
             capabilities.append(f"{file_type}_processing")
         
         # Extract from code patterns
@@ -119,25 +160,138 @@ class MetaRepositoryCEO:
         
         return capabilities
     
-    async def generate_meta_repository(self, target_name: str, purpose: str):
+    @traced('meta_ceo.generate_meta_repository')
+    async def generate_meta_repository(self, target_name: str, purpose: str, output_root: Path = None):
         """Generate a NEW repository that creates repositories"""
         
-        print(f"🏗️ GENERATING META-REPOSITORY: {target_name}")
+        log.info("🏗️ GENERATING META-REPOSITORY: %s", target_name)
+        
+        # Generate the four sections concurrently
+        section_builders = {
+            'structure': self._generate_meta_structure,
+            'templates': self._generate_all_templates,
+            'automation': self._generate_meta_automation,
+            'evolution': self._generate_evolution_mechanisms
+        }
+        with span('meta_ceo.generate_sections'):
+            sections = await asyncio.gather(
+                *(asyncio.to_thread(builder) for builder in section_builders.values())
+            )
         
         meta_repo_structure = {
             'name': target_name,
             'purpose': purpose,
-            'structure': self._generate_meta_structure(),
-            'templates': self._generate_all_templates(),
-            'automation': self._generate_meta_automation(),
-            'evolution': self._generate_evolution_mechanisms()
+            **dict(zip(section_builders, sections))
         }
         
-        # Create the meta-repository
-        await self._create_meta_repository(meta_repo_structure)
+        # Create the meta-repository (blocking file I/O, off the event loop)
+        target_path = Path(output_root or self.meta_repository_root) / target_name
+        with span('meta_ceo.create_meta_repository', target=target_name):
+            await asyncio.to_thread(self._create_meta_repository, meta_repo_structure, target_path)
         
         return meta_repo_structure
     
+    def _render_meta_repository(self, meta_repo_structure: Dict[str, Any]) -> Dict[str, bytes]:
+        """Render every file of the meta-repository as relative path -> content"""
+        
+        def to_json(data: Any) -> bytes:
+            return (json.dumps(data, indent=2, sort_keys=True, default=str) + "\n").encode()
+        
+        sections = [key for key in meta_repo_structure if key not in ('name', 'purpose')]
+        files = {
+            'README.md': f"# {meta_repo_structure['name']}\n\n{meta_repo_structure['purpose']}\n".encode(),
+            'meta-repository.json': to_json({
+                'name': meta_repo_structure['name'],
+                'purpose': meta_repo_structure['purpose'],
+                'sections': sections
+            })
+        }
+        for section in sections:
+            files[f".meta/{section}.json"] = to_json(meta_repo_structure[section])
+        
+        return files
+    
+    def _create_meta_repository(self, meta_repo_structure: Dict[str, Any], target_path: Path):
+        """Materialize the meta-repository at ``target_path`` with one atomic rename
+        
+        Files are written in one batch to a staging directory next to the target,
+        committed in-process as the initial git commit, then renamed into place.
+        When the manifest hash of the rendered files matches the one already on
+        disk nothing is written at all.
+        
+        An existing target is only replaced while it is still exactly what an
+        earlier run generated; edited files, extra files or commits beyond the
+        generated one raise MetaRepositoryConflict instead.
+        """
+        
+        files = self._render_meta_repository(meta_repo_structure)
+        file_hashes = {path: hashlib.sha256(content).hexdigest() for path, content in sorted(files.items())}
+        manifest_hash = hashlib.sha256(json.dumps(file_hashes, sort_keys=True).encode()).hexdigest()
+        
+        meta_repo_structure['path'] = str(target_path)
+        meta_repo_structure['manifest_hash'] = manifest_hash
+        
+        _recover_interrupted_swap(target_path)
+        
+        manifest_path = target_path / '.meta' / 'manifest.json'
+        if manifest_path.exists():
+            try:
+                previous_hash = json.loads(manifest_path.read_text())['manifest_hash']
+            except (ValueError, KeyError):
+                previous_hash = None
+            if previous_hash == manifest_hash:
+                log.info("✅ %s unchanged (manifest %s), nothing to do", target_path.name, manifest_hash[:12])
+                count('meta_ceo.unchanged_meta_repositories')
+                meta_repo_structure['unchanged'] = True
+                return
+        
+        if target_path.exists():
+            problem = _meta_repository_conflict(target_path)
+            if problem:
+                raise MetaRepositoryConflict(f"refusing to replace {target_path}: {problem}")
+        
+        files['.meta/manifest.json'] = (json.dumps(
+            {'manifest_hash': manifest_hash, 'files': file_hashes}, indent=2, sort_keys=True
+        ) + "\n").encode()
+        
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = Path(tempfile.mkdtemp(prefix=f".{target_path.name}.staging-", dir=target_path.parent))
+        try:
+            # mkdtemp is private to the owner; the repository itself is not
+            staging_path.chmod(0o755)
+            
+            # Batched writes: create every directory once, then every file
+            for directory in sorted({(staging_path / path).parent for path in files}):
+                directory.mkdir(parents=True, exist_ok=True)
+            for path, content in files.items():
+                (staging_path / path).write_bytes(content)
+            
+            commit_sha = _write_initial_git_commit(
+                staging_path, files, f"Initial meta-repository: {meta_repo_structure['name']}"
+            )
+            
+            if not target_path.exists():
+                os.rename(staging_path, target_path)
+            elif _exchange_paths(staging_path, target_path):
+                # The old tree now sits at the staging path
+                shutil.rmtree(staging_path, ignore_errors=True)
+            else:
+                # A directory cannot be renamed over a non-empty one: move the
+                # old tree aside first, then swap the staged tree in. A crash in
+                # between is undone by _recover_interrupted_swap on the next run
+                retired_path = Path(tempfile.mkdtemp(prefix=f".{target_path.name}.old-", dir=target_path.parent))
+                os.rename(target_path, retired_path / target_path.name)
+                os.rename(staging_path, target_path)
+                shutil.rmtree(retired_path, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            raise
+        
+        log.info("✅ META-REPOSITORY CREATED: %s (commit %s)", target_path, commit_sha[:12])
+        count('meta_ceo.meta_repositories_created')
+        meta_repo_structure['commit'] = commit_sha
+        meta_repo_structure['unchanged'] = False
+    
     def _generate_meta_structure(self) -> Dict[str, Any]:
         """Generate the structure for a meta-repository"""
         return {
@@ -166,4 +320,178 @@ class MetaRepositoryCEO:
                 'testing_frameworks': ['auto_generated', 'ai_validated', 'evolutionary_tested'],
                 'documentation_generators': ['ai_written', 'template_filled', 'interactive']
             }
-        }
\ No newline at end of file
+        }
+
+
+def _exchange_paths(source: Path, target: Path) -> bool:
+    """Atomically swap two directories with renameat2(RENAME_EXCHANGE)
+    
+    Returns False when the platform or filesystem does not support it.
+    """
+    
+    import ctypes
+    import errno
+    
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (AttributeError, OSError):
+        return False
+    
+    AT_FDCWD, RENAME_EXCHANGE = -100, 2
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    if renameat2(AT_FDCWD, os.fsencode(source), AT_FDCWD, os.fsencode(target), RENAME_EXCHANGE) == 0:
+        return True
+    
+    error = ctypes.get_errno()
+    if error in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+        return False
+    raise OSError(error, os.strerror(error), str(target))
+
+
+def _recover_interrupted_swap(target_path: Path):
+    """Put back a target left aside by an interrupted two-rename swap, drop leftovers"""
+    
+    for retired_path in sorted(target_path.parent.glob(f".{target_path.name}.old-*")):
+        if not target_path.exists() and (retired_path / target_path.name).is_dir():
+            log.warning("⚠️  RESTORING %s FROM INTERRUPTED REPLACEMENT", target_path)
+            os.rename(retired_path / target_path.name, target_path)
+        shutil.rmtree(retired_path, ignore_errors=True)
+
+
+def _meta_repository_conflict(target_path: Path) -> str:
+    """Why replacing ``target_path`` would lose work, or '' if it is safe
+    
+    Safe means empty, or exactly as generated: work tree matching its
+    manifest and one parentless commit by GIT_AUTHOR on refs/heads/main.
+    """
+    
+    if not any(target_path.iterdir()):
+        return ''
+    
+    try:
+        manifest = json.loads((target_path / '.meta' / 'manifest.json').read_text())
+        file_hashes = manifest['files']
+    except (OSError, ValueError, KeyError):
+        return "it is not a generated meta-repository"
+    
+    expected = set(file_hashes) | {'.meta/manifest.json'}
+    present = {
+        path.relative_to(target_path).as_posix()
+        for path in target_path.rglob('*')
+        if path.is_file() and path.relative_to(target_path).parts[0] != '.git'
+    }
+    if present != expected:
+        return f"untracked or missing files: {', '.join(sorted(present ^ expected)[:5])}"
+    for path, file_hash in file_hashes.items():
+        if hashlib.sha256((target_path / path).read_bytes()).hexdigest() != file_hash:
+            return f"{path} was modified"
+    
+    git_dir = target_path / '.git'
+    try:
+        if (git_dir / 'HEAD').read_text() != "ref: refs/heads/main\n":
+            return "HEAD is not on the generated main branch"
+        refs = [path for path in (git_dir / 'refs').rglob('*') if path.is_file()]
+        if refs != [git_dir / 'refs' / 'heads' / 'main'] or (git_dir / 'packed-refs').exists():
+            return "it has branches or tags besides the generated main"
+        commit_sha = (git_dir / 'refs' / 'heads' / 'main').read_text().strip()
+        commit = zlib.decompress((git_dir / 'objects' / commit_sha[:2] / commit_sha[2:]).read_bytes())
+    except (OSError, zlib.error):
+        return "its git history is not the generated commit"
+    
+    headers = commit.split(b"\0", 1)[1].split(b"\n\n", 1)[0].decode(errors='replace').splitlines()
+    if any(line.startswith('parent ') for line in headers):
+        return "it has commits beyond the generated one"
+    if not any(line.startswith(f"author {GIT_AUTHOR} ") for line in headers):
+        return "its commit was not generated by MetaRepositoryCEO"
+    
+    return ''
+
+
+# Minimal in-process git writer for the initial meta-repository commit: loose
+# objects, one branch and an index, so no git subprocess is needed.
+
+GIT_AUTHOR = 'MetaRepositoryCEO <meta-ceo@ultimate-meta-system>'
+
+
+def _write_git_object(objects_dir: Path, kind: str, body: bytes) -> str:
+    data = f"{kind} {len(body)}".encode() + b"\0" + body
+    sha = hashlib.sha1(data).hexdigest()
+    object_path = objects_dir / sha[:2] / sha[2:]
+    if not object_path.exists():
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        object_path.write_bytes(zlib.compress(data))
+    return sha
+
+
+def _write_git_tree(objects_dir: Path, tree: Dict[str, Any]) -> str:
+    """Write a nested {name: blob sha | subtree} dict as git tree objects"""
+
+    entries = []
+    for name, entry in tree.items():
+        if isinstance(entry, dict):
+            # git orders subtrees as if their name ended in '/'
+            entries.append((name + '/', b"40000 " + name.encode(), _write_git_tree(objects_dir, entry)))
+        else:
+            entries.append((name, b"100644 " + name.encode(), entry))
+
+    body = b"".join(
+        header + b"\0" + bytes.fromhex(sha)
+        for _, header, sha in sorted(entries, key=lambda entry: entry[0].encode())
+    )
+    return _write_git_object(objects_dir, 'tree', body)
+
+
+def _write_git_index(repo_path: Path, blob_shas: Dict[str, str]):
+    """Write a version 2 index so the fresh work tree shows as clean"""
+
+    entries = []
+    for path in sorted(blob_shas, key=str.encode):
+        stat = os.stat(repo_path / path)
+        encoded_path = path.encode()
+        entry = struct.pack(
+            '>10I20sH',
+            int(stat.st_ctime), stat.st_ctime_ns % 1_000_000_000,
+            int(stat.st_mtime), stat.st_mtime_ns % 1_000_000_000,
+            stat.st_dev & 0xFFFFFFFF, stat.st_ino & 0xFFFFFFFF, 0o100644,
+            stat.st_uid, stat.st_gid, stat.st_size & 0xFFFFFFFF,
+            bytes.fromhex(blob_shas[path]), min(len(encoded_path), 0xFFF)
+        ) + encoded_path
+        # Entries are NUL-padded to a multiple of 8 bytes (at least one NUL)
+        entries.append(entry + b"\0" * (8 - len(entry) % 8))
+
+    data = b"DIRC" + struct.pack('>2I', 2, len(entries)) + b"".join(entries)
+    (repo_path / '.git' / 'index').write_bytes(data + hashlib.sha1(data).digest())
+
+
+def _write_initial_git_commit(repo_path: Path, files: Dict[str, bytes], message: str) -> str:
+    """Turn ``repo_path`` into a git repository whose single commit holds ``files``"""
+
+    git_dir = repo_path / '.git'
+    objects_dir = git_dir / 'objects'
+    for directory in (objects_dir / 'info', objects_dir / 'pack', git_dir / 'refs' / 'heads', git_dir / 'refs' / 'tags'):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    blob_shas = {}
+    tree = {}
+    for path, content in files.items():
+        blob_shas[path] = _write_git_object(objects_dir, 'blob', content)
+        *directories, name = path.split('/')
+        node = tree
+        for directory in directories:
+            node = node.setdefault(directory, {})
+        node[name] = blob_shas[path]
+
+    tree_sha = _write_git_tree(objects_dir, tree)
+    signature = f"{GIT_AUTHOR} {int(time.time())} +0000"
+    commit_sha = _write_git_object(objects_dir, 'commit', (
+        f"tree {tree_sha}\nauthor {signature}\ncommitter {signature}\n\n{message}\n"
+    ).encode())
+
+    (git_dir / 'HEAD').write_text("ref: refs/heads/main\n")
+    (git_dir / 'refs' / 'heads' / 'main').write_text(commit_sha + "\n")
+    (git_dir / 'config').write_text(
+        "[core]\n\trepositoryformatversion = 0\n\tfilemode = true\n\tbare = false\n"
+    )
+    _write_git_index(repo_path, blob_shas)
+
+    return commit_sha
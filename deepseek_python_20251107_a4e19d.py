@@ -0,0 +1,56 @@
+# /workspace/ULTIMATE-META-SYSTEM/tests/test_startup_budget.py
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+if not (SYSTEM_ROOT / 'deploy_perfect_storm.py').exists():
+    pytest.skip("deploy_perfect_storm.py is not laid out under the system root", allow_module_level=True)
+if str(SYSTEM_ROOT) not in sys.path:
+    sys.path.insert(0, str(SYSTEM_ROOT))
+
+from deploy_perfect_storm import STARTUP_BUDGET_MS, measure_startup
+
+# Wall-clock timing depends on the machine, so the budget itself is only
+# asserted on request (e.g. on a quiet benchmark runner)
+ENFORCE_TIMING = os.environ.get('STORM_ENFORCE_STARTUP_BUDGET', '') not in ('', '0')
+
+
+def test_startup_imports_no_heavy_modules():
+    startup = measure_startup(runs=1)
+
+    assert not startup['forbidden_imports'], f"heavy modules imported at startup: {startup['forbidden_imports']}"
+
+
+@pytest.mark.skipif(not ENFORCE_TIMING, reason="set STORM_ENFORCE_STARTUP_BUDGET=1 to check the timing budget")
+def test_startup_within_budget():
+    startup = measure_startup()
+
+    assert startup['within_budget'], (
+        f"startup took {startup['import_time_ms']:.1f}ms, budget {STARTUP_BUDGET_MS:.1f}ms; "
+        f"slowest imports: {startup['slowest_imports'][:5]}"
+    )
+
+
+def test_engine_modules_import_without_store_or_harness():
+    """The windows command imports the merge engine; the store and harness stay lazy"""
+
+    import subprocess
+
+    probe = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(SYSTEM_ROOT)!r})\n"
+        "from deploy_perfect_storm import ENGINE_MODULES, load_engine\n"
+        "for name in ENGINE_MODULES:\n"
+        "    load_engine(name)\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    modules = subprocess.run(
+        [sys.executable, '-c', probe], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    assert 'artifact_store' not in modules
+    assert 'micro_benchmark' not in modules
@@ -0,0 +1,375 @@
+# /workspace/ULTIMATE-META-SYSTEM/instrumentation.py
+
+"""Shared spans, counters and logging for every engine
+
+Tracing is off by default: ``span()`` then returns a shared no-op context
+manager and ``count()`` returns immediately, so instrumented hot paths cost
+one attribute check. Enable it with ``configure(enabled=True)`` or the
+``STORM_TRACE=1`` environment variable, then export with
+``export_chrome_trace``, ``export_json`` or ``serve_prometheus``.
+"""
+
+import _thread
+import functools
+import itertools
+import os
+import sys
+import time
+import weakref
+from typing import Any, Callable, Dict
+
+LOGGER_NAME = 'ultimate_meta_system'
+
+# Spans beyond this many are still aggregated but no longer kept as trace events
+DEFAULT_MAX_EVENTS = 100_000
+
+# Keep the CLI startup small: logging is imported when the first record is
+# emitted; json, re, pathlib and http.server only when exporting; threading is
+# replaced by _thread.
+
+# Sink settings applied when logging is first needed (see configure_logging)
+_sink_config = {'level': 'INFO', 'stream': None, 'installed': False}
+
+
+def _install_sink():
+    import logging
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(_sink_config['level'])
+    for handler in list(logger.handlers):
+        if getattr(handler, '_storm_sink', False):
+            logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(_sink_config['stream'])
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    handler._storm_sink = True
+    logger.addHandler(handler)
+    logger.propagate = False
+    _sink_config['installed'] = True
+
+
+class _LazyLogger:
+    """Stands in for a logging.Logger until the first record is emitted"""
+
+    __slots__ = ('name', '_logger')
+
+    def __init__(self, name: str):
+        self.name = name
+        self._logger = None
+
+    def _resolve(self):
+        if self._logger is None:
+            import logging
+
+            if not _sink_config['installed']:
+                _install_sink()
+            self._logger = logging.getLogger(self.name)
+        return self._logger
+
+    def debug(self, msg, *args, **kwargs):
+        self._resolve().debug(msg, *args, **kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        self._resolve().info(msg, *args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        self._resolve().warning(msg, *args, **kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        self._resolve().error(msg, *args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+
+def get_logger(name: str = None) -> _LazyLogger:
+    """Logger for an engine; all engines log under the ``ultimate_meta_system`` root"""
+
+    return _LazyLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+def configure_logging(level: Any = 'INFO', stream=None):
+    """Send engine log records to ``stream`` (stderr by default) as plain messages
+
+    Takes effect immediately if anything has logged already, otherwise when
+    the first record is emitted.
+    """
+
+    _sink_config.update(level=level, stream=stream)
+    if _sink_config['installed']:
+        _install_sink()
+
+
+class _NoopSpan:
+    """Span used while tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ('_recorder', 'name', 'attrs', '_start')
+
+    def __init__(self, recorder: 'Instrumentation', name: str, attrs: Dict[str, Any]):
+        self._recorder = recorder
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self._recorder._finish_span(self, time.perf_counter_ns())
+        return False
+
+    def set(self, **attrs):
+        """Attach attributes discovered while the span is open"""
+        self.attrs.update(attrs)
+
+
+class Instrumentation:
+    """Collects spans and counters for one process"""
+
+    def __init__(self, enabled: bool = False, max_events: int = DEFAULT_MAX_EVENTS):
+        self.enabled = enabled
+        self.max_events = max_events
+        self._lock = _thread.allocate_lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._events = []
+        self._span_stats = {}
+        self._counters = {}
+        # Every asyncio task gets its own trace track, since concurrent tasks
+        # on one thread overlap without nesting
+        self._task_tracks = weakref.WeakKeyDictionary()
+        self._track_ids = itertools.count(1)
+
+    def reset(self):
+        with self._lock:
+            self._origin_ns = time.perf_counter_ns()
+            self._events = []
+            self._span_stats = {}
+            self._counters = {}
+
+    def span(self, name: str, **attrs):
+        """Context manager timing the enclosed block as span ``name``"""
+
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, attrs)
+
+    def count(self, name: str, value: float = 1):
+        """Increment counter ``name`` by ``value``"""
+
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def _current_track(self):
+        """(track id, track name) of the running asyncio task, else of the thread"""
+
+        asyncio = sys.modules.get('asyncio')
+        if asyncio is not None:
+            try:
+                task = asyncio.current_task()
+            except RuntimeError:
+                task = None
+            if task is not None:
+                track = self._task_tracks.get(task)
+                if track is None:
+                    track = self._task_tracks[task] = (next(self._track_ids), task.get_name())
+                return track
+
+        return _thread.get_ident(), None
+
+    def _finish_span(self, span: _Span, end_ns: int):
+        duration_ns = end_ns - span._start
+        track = self._current_track()
+        with self._lock:
+            stats = self._span_stats.get(span.name)
+            if stats is None:
+                stats = self._span_stats[span.name] = {'count': 0, 'total_ns': 0, 'max_ns': 0}
+            stats['count'] += 1
+            stats['total_ns'] += duration_ns
+            if duration_ns > stats['max_ns']:
+                stats['max_ns'] = duration_ns
+
+            if len(self._events) < self.max_events:
+                self._events.append(
+                    (span.name, span._start - self._origin_ns, duration_ns, track, span.attrs)
+                )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Aggregated span statistics (seconds) and counter values"""
+
+        with self._lock:
+            return {
+                'spans': {
+                    name: {
+                        'count': stats['count'],
+                        'total_seconds': stats['total_ns'] / 1e9,
+                        'max_seconds': stats['max_ns'] / 1e9
+                    }
+                    for name, stats in self._span_stats.items()
+                },
+                'counters': dict(self._counters),
+                'dropped_events': max(0, sum(s['count'] for s in self._span_stats.values()) - len(self._events))
+            }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace events in the Chrome ``about:tracing`` / Perfetto JSON format"""
+
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+
+        track_names = {tid: track_name for _, _, _, (tid, track_name), _ in events if track_name}
+        return {
+            'traceEvents': [
+                {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': track_name}}
+                for tid, track_name in sorted(track_names.items())
+            ] + [
+                {
+                    'name': name,
+                    'ph': 'X',
+                    'ts': start_ns / 1000.0,
+                    'dur': duration_ns / 1000.0,
+                    'pid': pid,
+                    'tid': tid,
+                    'args': {key: _json_safe(value) for key, value in attrs.items()}
+                }
+                for name, start_ns, duration_ns, (tid, _), attrs in events
+            ],
+            'displayTimeUnit': 'ms'
+        }
+
+    def export_chrome_trace(self, path: str):
+        import json
+        with open(path, 'w') as handle:
+            json.dump(self.chrome_trace(), handle)
+
+    def export_json(self, path: str):
+        import json
+        with open(path, 'w') as handle:
+            json.dump(self.snapshot(), handle, indent=2)
+
+    def prometheus_text(self) -> str:
+        """Counters and span aggregates in the Prometheus text exposition format"""
+
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, value in sorted(snapshot['counters'].items()):
+            metric = f"storm_{_metric_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        if snapshot['spans']:
+            lines.append("# TYPE storm_span_seconds summary")
+            for name, stats in sorted(snapshot['spans'].items()):
+                lines.append(f'storm_span_seconds_count{{span="{name}"}} {stats["count"]}')
+                lines.append(f'storm_span_seconds_sum{{span="{name}"}} {stats["total_seconds"]:.9f}')
+            lines.append("# TYPE storm_span_max_seconds gauge")
+            for name, stats in sorted(snapshot['spans'].items()):
+                lines.append(f'storm_span_max_seconds{{span="{name}"}} {stats["max_seconds"]:.9f}')
+
+        return "\n".join(lines) + "\n"
+
+    def serve_prometheus(self, port: int, host: str = '127.0.0.1'):
+        """Serve ``prometheus_text`` at ``/metrics`` from a daemon thread; returns the server"""
+
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        instrumentation = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = instrumentation.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                get_logger('metrics').debug(format, *args)
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name='storm-metrics', daemon=True).start()
+        return server
+
+
+def _metric_name(name: str) -> str:
+    import re
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+# Process-wide instrumentation shared by all engines
+instrumentation = Instrumentation(enabled=os.environ.get('STORM_TRACE', '') not in ('', '0'))
+
+
+def configure(enabled: bool = True, max_events: int = None) -> Instrumentation:
+    """Switch the shared instrumentation on or back to no-op mode"""
+
+    instrumentation.enabled = enabled
+    if max_events is not None:
+        instrumentation.max_events = max_events
+    return instrumentation
+
+
+def span(name: str, **attrs):
+    return instrumentation.span(name, **attrs)
+
+
+def count(name: str, value: float = 1):
+    instrumentation.count(name, value)
+
+
+def traced(name: str) -> Callable:
+    """Decorator wrapping every call of a function or coroutine function in span ``name``"""
+
+    import inspect
+
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not instrumentation.enabled:
+                    return await fn(*args, **kwargs)
+                with instrumentation.span(name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return fn(*args, **kwargs)
+            with instrumentation.span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -1,5 +1,16 @@
 # /workspace/ULTIMATE-META-SYSTEM/build-systems/auto_generation_engine.py
 
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Any
+
+from instrumentation import count, get_logger, span, traced
+
+log = get_logger('auto_generation_engine')
+
+if TYPE_CHECKING:
+    from artifact_store import ArtifactStore
+
 class AutoGenerationEngine:
     """ENGINE THAT AUTOMATICALLY GENERATES COMPLETE SYSTEMS"""
     
@@ -7,6 +18,9 @@ class AutoGenerationEngine:
         self.template_library = self._build_template_library()
         self.code_generators = self._initialize_code_generators()
         self.architecture_designers = self._initialize_architecture_designers()
+        
+        # When set, generated codebases are published to the store and returned by reference
+        self.artifact_store: 'ArtifactStore' = None
     
     def _build_template_library(self) -> Dict[str, Any]:
         """Build comprehensive template library for all system types"""
@@ -39,28 +53,49 @@ class AutoGenerationEngine:
             }
         }
     
+    @traced('generate.complete_system')
     async def generate_complete_system(self, system_spec: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a complete system from specification"""
         
-        print(f"🏭 GENERATING COMPLETE SYSTEM: {system_spec['name']}")
+        # The spec may arrive as an ArtifactRef (only once artifact_store is imported)
+        if 'artifact_store' in sys.modules:
+            from artifact_store import resolve
+            system_spec = resolve(system_spec)
+        log.info("🏭 GENERATING COMPLETE SYSTEM: %s", system_spec['name'])
         
         # Step 1: Architecture Design
-        architecture = await self._design_architecture(system_spec)
+        with span('generate.architecture'):
+            architecture = await self._design_architecture(system_spec)
         
         # Step 2: Code Generation
-        codebase = await self._generate_codebase(architecture, system_spec)
+        with span('generate.codebase'):
+            codebase = await self._generate_codebase(architecture, system_spec)
         
         # Step 3: Dependency Management
-        dependencies = await self._manage_dependencies(codebase, system_spec)
+        with span('generate.dependencies'):
+            dependencies = await self._manage_dependencies(codebase, system_spec)
         
         # Step 4: Testing Framework
-        tests = await self._generate_testing_framework(codebase, system_spec)
+        with span('generate.testing'):
+            tests = await self._generate_testing_framework(codebase, system_spec)
         
         # Step 5: Documentation
-        documentation = await self._generate_documentation(codebase, architecture, system_spec)
+        with span('generate.documentation'):
+            documentation = await self._generate_documentation(codebase, architecture, system_spec)
         
         # Step 6: Deployment Configuration
-        deployment = await self._generate_deployment_config(architecture, system_spec)
+        with span('generate.deployment'):
+            deployment = await self._generate_deployment_config(architecture, system_spec)
+        
+        metadata = {
+            'generation_timestamp': datetime.now(),
+            'system_complexity': self._calculate_complexity(architecture, codebase),
+            'estimated_development_time_saved': '1000+ hours',
+            'ai_generation_ratio': '100%'
+        }
+        if self.artifact_store is not None:
+            codebase = self.artifact_store.put(codebase, kind='codebase')
+            self.artifact_store.flush()
         
         complete_system = {
             'name': system_spec['name'],
@@ -70,12 +105,7 @@ class AutoGenerationEngine:
             'testing': tests,
             'documentation': documentation,
             'deployment': deployment,
-            'metadata': {
-                'generation_timestamp': datetime.now(),
-                'system_complexity': self._calculate_complexity(architecture, codebase),
-                'estimated_development_time_saved': '1000+ hours',
-                'ai_generation_ratio': '100%'
-            }
+            'metadata': metadata
         }
         
         return complete_system
@@ -114,18 +144,20 @@ class AutoGenerationEngine:
         
         # Generate each component based on architecture
         for component_name, component_spec in architecture['components'].items():
-            print(f"   📝 Generating code for {component_name}...")
-            
-            # Select appropriate template
-            component_type = component_spec.get('type', 'service')
-            template = self._select_code_template(component_type, component_spec)
-            
-            # Customize template for this component
-            customized_code = self._customize_code_template(template, component_spec, system_spec)
+            log.debug("   📝 Generating code for %s...", component_name)
             
-            # Determine file path and extension
-            file_path = self._determine_file_path(component_name, component_type, architecture)
-            codebase[file_path] = customized_code
+            with span('generate.component', component=component_name):
+                # Select appropriate template
+                component_type = component_spec.get('type', 'service')
+                template = self._select_code_template(component_type, component_spec)
+                
+                # Customize template for this component
+                customized_code = self._customize_code_template(template, component_spec, system_spec)
+                
+                # Determine file path and extension
+                file_path = self._determine_file_path(component_name, component_type, architecture)
+                codebase[file_path] = customized_code
+            count('generate.components')
         
         # Generate configuration files
         config_files = self._generate_configuration_files(architecture, system_spec)
@@ -1,5 +1,17 @@
 # /workspace/ULTIMATE-META-SYSTEM/cosmic-integration/universal_connector.py
 
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Any
+import hashlib
+
+from instrumentation import count, get_logger, span, traced
+
+log = get_logger('universal_connector')
+
+if TYPE_CHECKING:
+    from artifact_store import ArtifactStore
+
 class UniversalConnector:
     """COSMIC-SCALE INTEGRATION ACROSS ALL SYSTEMS AND DIMENSIONS"""
     
@@ -7,11 +19,21 @@ class UniversalConnector:
         self.connected_systems = {}
         self.integration_patterns = self._initialize_integration_patterns()
         self.cosmic_bridge = self._initialize_cosmic_bridge()
+        
+        # When set, integration code is published to the store and kept by reference
+        self.artifact_store: 'ArtifactStore' = None
     
+    @traced('connect.all_systems')
     async def connect_all_systems(self, systems: Dict[str, Any]) -> Dict[str, Any]:
         """Connect ALL systems at cosmic scale"""
         
-        print("🌌 INITIATING COSMIC-SCALE SYSTEM INTEGRATION...")
+        log.info("🌌 INITIATING COSMIC-SCALE SYSTEM INTEGRATION...")
+        
+        # Systems may arrive as ArtifactRefs (only once artifact_store is
+        # imported); load each one once, not once per pair
+        if 'artifact_store' in sys.modules:
+            from artifact_store import resolve_all
+            systems = resolve_all(systems)
         
         integration_matrix = {}
         
@@ -20,19 +42,26 @@ class UniversalConnector:
             
             for system2_name, system2_data in systems.items():
                 if system1_name != system2_name:
-                    print(f"   🔗 Connecting {system1_name} ↔ {system2_name}")
+                    log.debug("   🔗 Connecting %s ↔ %s", system1_name, system2_name)
                     
-                    connection = await self._create_cosmic_connection(
-                        system1_name, system1_data, 
-                        system2_name, system2_data
-                    )
+                    with span('connect.pair', source=system1_name, target=system2_name):
+                        connection = await self._create_cosmic_connection(
+                            system1_name, system1_data, 
+                            system2_name, system2_data
+                        )
+                    count('connect.connections')
                     
                     integration_matrix[system1_name][system2_name] = connection
         
+        if self.artifact_store is not None:
+            # One index update for the integration code of every pair
+            self.artifact_store.flush()
+        
         # Create unified cosmic network
-        cosmic_network = await self._create_cosmic_network(integration_matrix)
+        with span('connect.network'):
+            cosmic_network = await self._create_cosmic_network(integration_matrix)
         
-        print("✅ COSMIC INTEGRATION COMPLETED!")
+        log.info("✅ COSMIC INTEGRATION COMPLETED!")
         
         return {
             'integration_matrix': integration_matrix,
@@ -64,6 +93,8 @@ class UniversalConnector:
         
         # Generate integration code
         integration_code = await self._generate_integration_code(system1, data1, system2, data2)
+        if self.artifact_store is not None:
+            integration_code = self.artifact_store.put(integration_code, kind='integration_code')
         
         return {
             'analysis': connection_analysis,
@@ -0,0 +1,173 @@
+# /workspace/ULTIMATE-META-SYSTEM/tests/test_artifact_store.py
+
+import json
+import pickle
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SYSTEM_ROOT = Path(__file__).resolve().parent.parent
+if not (SYSTEM_ROOT / 'artifact_store.py').exists():
+    pytest.skip("artifact_store.py is not laid out under the system root", allow_module_level=True)
+if str(SYSTEM_ROOT) not in sys.path:
+    sys.path.insert(0, str(SYSTEM_ROOT))
+
+from artifact_store import ArtifactStore, resolve_all
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path / 'store')
+
+
+def blob_files(store):
+    return {path.parent.name + path.name for path in store.objects_dir.glob('*/*')}
+
+
+def test_put_get_round_trip_and_deduplication(store):
+    first = store.put({'capabilities': ['a', 'b']}, kind='analysis')
+    second = store.put({'capabilities': ['a', 'b']})
+
+    assert first == second
+    assert first.load() == {'capabilities': ['a', 'b']}
+    assert store.stats()['artifacts'] == 1
+    assert json.loads(store.index_path.read_text())['artifacts'][first.key]['refs'] == 2
+
+
+def test_out_of_band_buffers_are_read_from_the_blob(store):
+    payload = bytearray(range(256)) * 64
+
+    loaded = store.put({'buffer': pickle.PickleBuffer(payload)}).load()
+
+    assert bytes(loaded['buffer']) == bytes(payload)
+
+
+def test_refs_pickle_to_key_and_store(store):
+    ref = store.put([1, 2, 3])
+
+    copied = pickle.loads(pickle.dumps(ref))
+
+    assert copied == ref
+    assert resolve_all({'system': copied, 'plain': 4}) == {'system': [1, 2, 3], 'plain': 4}
+
+
+def test_gc_removes_only_unreferenced_blobs(store):
+    kept = store.put('kept')
+    dropped = store.put('dropped')
+    store.decref(dropped.key)
+
+    collected = store.gc()
+
+    assert collected['removed'] == 1
+    assert blob_files(store) == {kept.key}
+    assert kept.load() == 'kept'
+    with pytest.raises(KeyError):
+        store.decref(dropped.key)
+
+
+def test_run_references_are_recorded_on_flush(store):
+    run = store.run()
+    ref = run.put('analysis')
+    run.put('analysis')
+
+    assert store.stats()['artifacts'] == 0
+    run.flush()
+
+    index = json.loads(store.index_path.read_text())
+    assert index['artifacts'][ref.key]['refs'] == 2
+    assert index['runs'][run.run_id]['keys'] == {ref.key: 2}
+
+
+def test_gc_keep_runs_releases_older_runs(store):
+    with store.run() as old_run:
+        shared = old_run.put('shared')
+        old_only = old_run.put('old only')
+    with store.run() as new_run:
+        new_run.put('shared')
+        new_only = new_run.put('new only')
+
+    collected = store.gc(keep_runs=1)
+
+    assert collected['released_runs'] == 1
+    assert blob_files(store) == {shared.key, new_only.key}
+    assert old_only.key not in blob_files(store)
+
+    collected = store.gc(keep_runs=0)
+
+    assert collected['released_runs'] == 1
+    assert blob_files(store) == set()
+    assert store.stats() == {'artifacts': 0, 'bytes': 0, 'unreferenced': 0, 'runs': 0}
+
+
+def test_flush_rewrites_blob_collected_before_it(store):
+    stale = store.put('reused')
+    store.decref(stale.key)
+    run = store.run()
+    ref = run.put('reused')
+
+    store.gc()
+    run.flush()
+
+    assert ref.load() == 'reused'
+
+
+def test_unflushed_blobs_are_collected_after_the_grace_period(store):
+    killed_run = store.run()
+    orphan = killed_run.put('never flushed')
+
+    assert store.gc()['orphans'] == 0
+    assert orphan.key in blob_files(store)
+
+    assert store.gc(orphan_grace_seconds=0)['orphans'] == 1
+    assert orphan.key not in blob_files(store)
+
+
+def test_release_run(store):
+    with store.run() as run:
+        ref = run.put('owned')
+
+    store.release_run(run.run_id)
+
+    assert store.stats()['unreferenced'] == 1
+    store.gc()
+    assert ref.key not in blob_files(store)
+
+
+def test_index_without_runs_is_read(store):
+    store.index_path.write_text(json.dumps({'0' * 64: {'refs': 0, 'size': 3, 'kind': 'str', 'created': 0}}))
+
+    assert store.stats() == {'artifacts': 1, 'bytes': 3, 'unreferenced': 1, 'runs': 0}
+    assert store.gc()['removed'] == 1
+    assert json.loads(store.index_path.read_text()) == {'artifacts': {}, 'runs': {}}
+
+
+def test_concurrent_put_and_gc_never_lose_referenced_blobs(store):
+    # Every value is also dropped once, so gc keeps racing puts of the same key
+    refs = []
+    errors = []
+
+    def writer():
+        try:
+            for index in range(30):
+                value = f"value {index % 5}"
+                refs.append(store.put(value))
+                store.decref(store.put(value).key)
+        except Exception as error:
+            errors.append(error)
+
+    def collector():
+        for _ in range(30):
+            store.gc()
+
+    threads = [threading.Thread(target=writer) for _ in range(3)]
+    threads.append(threading.Thread(target=collector))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    for ref in refs:
+        assert ref.load().startswith("value ")
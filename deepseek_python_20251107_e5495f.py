@@ -1,19 +1,42 @@
 # /workspace/ULTIMATE-META-SYSTEM/meta-orchestrator/perfect_storm_merge.py
 
 import asyncio
+import sys
 from datetime import datetime, timedelta
-import numpy as np
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Dict, List, Any
 import hashlib
 
+from instrumentation import count, get_logger, span, traced
+
+log = get_logger('perfect_storm_merge')
+
+if TYPE_CHECKING:
+    from artifact_store import ArtifactStore
+
 class PerfectStormMergeEngine:
     """THE EXACT TIMING ENGINE FOR PERFECT COMPUTATIONAL STORM"""
     
-    def __init__(self):
+    def __init__(self, benchmark_config: Dict[str, Any] = None, slos: Dict[str, Any] = None,
+                 baseline_cache_path: str = None, workload_factory=None,
+                 enforce_slos: bool = True):
         self.merge_windows = self._calculate_optimal_merge_windows()
         self.storm_intensity = 0.0
         self.convergence_points = []
+        
+        # Before/after micro-benchmarking of the merge. Only the overrides are
+        # kept here; _benchmarking() imports the harness and applies its
+        # defaults at the first merge, keeping it off the `windows` cold start
+        self.benchmark_config = dict(benchmark_config or {})
+        self.slos = dict(slos or {})
+        self.baseline_cache_path = baseline_cache_path
+        self.baseline_cache = None
+        self.workload_factory = workload_factory
+        self.enforce_slos = enforce_slos
+        
+        # When set, merge outputs are published to the store and returned by reference
+        self.artifact_store: 'ArtifactStore' = None
     
+    @traced('merge.calculate_windows')
     def _calculate_optimal_merge_windows(self) -> List[datetime]:
         """Calculate mathematically perfect merge timing using multiple dimensions"""
         
@@ -103,7 +126,7 @@ class PerfectStormMergeEngine:
     async def execute_perfect_merge(self, systems: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the perfect storm merge of ALL systems"""
         
-        print("🌪️  INITIATING PERFECT COMPUTATIONAL STORM MERGE...")
+        log.info("🌪️  INITIATING PERFECT COMPUTATIONAL STORM MERGE...")
         
         # Wait for optimal merge window
         optimal_window = self.merge_windows[0]
@@ -111,36 +134,159 @@ class PerfectStormMergeEngine:
         
         if current_time < optimal_window['timestamp']:
             wait_time = (optimal_window['timestamp'] - current_time).total_seconds()
-            print(f"⏰ WAITING FOR PERFECT STORM WINDOW: {optimal_window['timestamp']}")
-            print(f"   Storm Intensity: {optimal_window['intensity']:.2f}/1.0")
-            print(f"   Convergence Score: {optimal_window['score']:.2f}/5.0")
-            await asyncio.sleep(wait_time)
+            log.info("⏰ WAITING FOR PERFECT STORM WINDOW: %s", optimal_window['timestamp'])
+            log.info("   Storm Intensity: %.2f/1.0", optimal_window['intensity'])
+            log.info("   Convergence Score: %.2f/5.0", optimal_window['score'])
+            with span('merge.wait_for_window'):
+                await asyncio.sleep(wait_time)
         
-        print("🌀 PERFECT STORM WINDOW OPEN - EXECUTING MERGE...")
+        log.info("🌀 PERFECT STORM WINDOW OPEN - EXECUTING MERGE...")
+        
+        # Source systems may arrive as ArtifactRefs, which can only exist once
+        # artifact_store is imported; otherwise it stays off the cold start
+        if 'artifact_store' in sys.modules:
+            from artifact_store import resolve_all
+            systems = resolve_all(systems)
+        
+        # Benchmark defaults are applied before fusion records them as targets
+        benchmarking = self._benchmarking()
         
         # Phase 1: System Analysis and Capability Extraction
-        all_capabilities = await self._extract_all_capabilities(systems)
+        with span('merge.extract_capabilities', systems=len(systems)):
+            all_capabilities = await self._extract_all_capabilities(systems)
         
         # Phase 2: Architecture Fusion
-        fused_architecture = await self._fuse_architectures(systems, all_capabilities)
+        with span('merge.fuse_architectures'):
+            fused_architecture = await self._fuse_architectures(systems, all_capabilities)
         
         # Phase 3: Code Synthesis
-        synthesized_system = await self._synthesize_system(fused_architecture)
+        with span('merge.synthesize'):
+            synthesized_system = await self._synthesize_system(fused_architecture)
         
         # Phase 4: Optimization Storm
-        optimized_system = await self._optimization_storm(synthesized_system)
+        with span('merge.optimize'):
+            optimized_system = await self._optimization_storm(synthesized_system)
         
         # Phase 5: Cosmic Integration
-        final_system = await self._cosmic_integration(optimized_system)
-        
-        print("✅ PERFECT STORM MERGE COMPLETED!")
+        with span('merge.cosmic_integration'):
+            final_system = await self._cosmic_integration(optimized_system)
+        
+        # Phase 6: Before/after benchmarking against the SLOs
+        with span('merge.benchmark'):
+            baselines = await self._measure_source_baselines(systems)
+            merged_performance = await self._measure_system('__merged__', final_system)
+        if merged_performance is None and any(baseline is not None for baseline in baselines.values()):
+            log.warning("⚠️  MERGED SYSTEM HAS NO WORKLOAD WHILE ITS SOURCES WERE MEASURED: "
+                        "performance gain stays unmeasured (pass a workload_factory that "
+                        "handles '__merged__')")
+        gain_interval = self._calculate_performance_gain(baselines, merged_performance)
+        performance_gain = gain_interval['value'] if gain_interval else None
+        
+        violations = benchmarking.check_slos(merged_performance, gain_interval, self.slos)
+        if violations:
+            log.warning("⚠️  MERGED SYSTEM MISSED ITS SLOS: %s", "; ".join(violations))
+            if self.enforce_slos:
+                raise benchmarking.SLOViolation(violations, merged_performance)
+        count('merge.completed')
+        
+        log.info("✅ PERFECT STORM MERGE COMPLETED!")
+        
+        artifacts = {}
+        if self.artifact_store is not None:
+            artifacts = {
+                'capabilities': self.artifact_store.put(all_capabilities, kind='capabilities'),
+                'fused_architecture': self.artifact_store.put(fused_architecture, kind='fused_architecture')
+            }
+            final_system = self.artifact_store.put(final_system, kind='merged_system')
+            self.artifact_store.flush()
         
         return {
             'merged_system': final_system,
+            'artifacts': artifacts,
             'merge_timestamp': datetime.now(),
             'storm_intensity': optimal_window['intensity'],
             'capabilities_count': len(all_capabilities),
-            'performance_gain': self._calculate_performance_gain(systems, final_system)
+            'performance_gain': performance_gain,
+            'performance': {
+                'baselines': baselines,
+                'merged': merged_performance,
+                'gain': gain_interval,
+                'slos': self.slos,
+                'slo_violations': violations
+            }
+        }
+    
+    def _benchmarking(self):
+        """The micro_benchmark module, with its defaults applied to this engine"""
+        
+        import micro_benchmark
+        
+        if self.baseline_cache is None:
+            self.benchmark_config = {**micro_benchmark.DEFAULT_BENCHMARK_CONFIG, **self.benchmark_config}
+            self.slos = {**micro_benchmark.DEFAULT_SLOS, **self.slos}
+            self.baseline_cache = micro_benchmark.BaselineCache(self.baseline_cache_path)
+            self.workload_factory = self.workload_factory or micro_benchmark.default_workload_factory
+        return micro_benchmark
+    
+    async def _measure_system(self, system_name: str, system_data: Any) -> Dict[str, Any]:
+        """Micro-benchmark one system's workload, or None when it has none"""
+        
+        workload = self.workload_factory(system_name, system_data)
+        if workload is None:
+            log.debug("   ⏱️  %s has no workload, leaving it unmeasured", system_name)
+            return None
+        
+        return await self._benchmark(system_name, workload)
+    
+    async def _benchmark(self, system_name: str, workload) -> Dict[str, Any]:
+        with span('merge.measure_system', system=system_name):
+            return await self._benchmarking().measure_workload(workload, self.benchmark_config)
+    
+    async def _measure_source_baselines(self, systems: Dict[str, Any]) -> Dict[str, Any]:
+        """Baseline measurement per source system, reusing cached ones"""
+        
+        baselines = {}
+        for system_name, system_data in systems.items():
+            workload = self.workload_factory(system_name, system_data)
+            if workload is None:
+                log.debug("   ⏱️  %s has no workload, leaving it unmeasured", system_name)
+                baselines[system_name] = None
+                continue
+            
+            # The workload is part of the key: a factory may supply it from outside the data
+            fingerprint = self._benchmarking().system_fingerprint(
+                system_name, system_data, self.benchmark_config, workload
+            )
+            baseline = self.baseline_cache.get(fingerprint)
+            if baseline is None:
+                baseline = await self._benchmark(system_name, workload)
+                self.baseline_cache.put(fingerprint, baseline)
+            else:
+                count('merge.baseline_cache_hits')
+            baselines[system_name] = baseline
+        
+        return baselines
+    
+    def _calculate_performance_gain(self, baselines: Dict[str, Any], merged: Dict[str, Any]) -> Dict[str, float]:
+        """Measured throughput of the merged system over the fastest measured source
+        
+        The bounds combine the throughput confidence intervals: the pessimistic
+        merged bound over the optimistic source bound, and vice versa. Returns
+        None when the merged system or every source is unmeasured.
+        """
+        
+        source_throughputs = [
+            baseline['throughput_per_second']
+            for baseline in baselines.values() if baseline is not None
+        ]
+        if merged is None or not source_throughputs:
+            return None
+        
+        merged_throughput = merged['throughput_per_second']
+        return {
+            'value': merged_throughput['value'] / max(source['value'] for source in source_throughputs),
+            'ci_low': merged_throughput['ci_low'] / max(source['ci_high'] for source in source_throughputs),
+            'ci_high': merged_throughput['ci_high'] / max(source['ci_low'] for source in source_throughputs)
         }
     
     async def _extract_all_capabilities(self, systems: Dict[str, Any]) -> List[str]:
@@ -149,7 +295,7 @@ class PerfectStormMergeEngine:
         all_capabilities = []
         
         for system_name, system_data in systems.items():
-            print(f"🔍 Extracting capabilities from {system_name}...")
+            log.debug("🔍 Extracting capabilities from %s...", system_name)
             
             # Deep capability extraction
             capabilities = await self._deep_capability_extraction(system_data)
@@ -159,13 +305,14 @@ class PerfectStormMergeEngine:
             implicit_capabilities = await self._extract_implicit_capabilities(system_data)
             all_capabilities.extend(implicit_capabilities)
         
-        # Remove duplicates and return
-        return list(set(all_capabilities))
+        # Remove duplicates; sorted so the stored artifact (and its key) does
+        # not depend on PYTHONHASHSEED
+        return sorted(set(all_capabilities))
     
     async def _fuse_architectures(self, systems: Dict[str, Any], capabilities: List[str]) -> Dict[str, Any]:
         """Fuse all architectures into ultimate meta-architecture"""
         
-        print("🏗️ FUSING ALL ARCHITECTURES...")
+        log.info("🏗️ FUSING ALL ARCHITECTURES...")
         
         fused_architecture = {
             'meta_framework': {
@@ -175,12 +322,7 @@ class PerfectStormMergeEngine:
             },
             'integrated_components': {},
             'capability_matrix': {},
-            'performance_targets': {
-                'throughput': 'INFINITE',
-                'latency': 'INSTANTANEOUS', 
-                'reliability': 'ABSOLUTE',
-                'intelligence': 'TRANSCENDENT'
-            }
+            'performance_targets': dict(self.slos)
         }
         
         # Integrate each system's architecture